@@ -0,0 +1,88 @@
+"""
+clustersim command line entry point, runs a scenario file and prints a
+summary of the results:
+
+    clustersim scenario.yaml --until 2000 --records results/
+    clustersim scenario.yaml --replicas 32
+"""
+
+from typing import List, Optional
+import argparse
+import os
+
+from clustersim.core.ensemble import Ensemble
+from clustersim.core.scenario import load_scenario, build_simulator
+from clustersim.core.simulator import Simulator
+
+
+def summarize(sim: Simulator):
+    """ print the summary from the raw records, without pandas
+    """
+    print('sim time: ', sim.env.now)
+
+    for key, value in sim.metrics().items():
+        print('{}: {}'.format(key, value))
+
+
+def summarize_ensemble(ensemble: Ensemble, until: float):
+    print('sim time: ', until)
+    print('replicas: ', ensemble.replicas)
+
+    for key, (mean, low, high) in ensemble.summary().items():
+        print('{}: {} [{}, {}]'.format(key, mean, low, high))
+
+
+def write_records(sim: Simulator, path: str, prefix: str = ''):
+    os.makedirs(path, exist_ok=True)
+    for node in sim.nodes:
+        node.records.to_csv(os.path.join(
+            path, '{}node-{}.csv'.format(prefix, node.node_id)))
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        prog='clustersim',
+        description='Run a cluster scheduler simulation scenario')
+    parser.add_argument('scenario', help='scenario file, json or yaml')
+    parser.add_argument('--until', type=float,
+                        help='simulation end time, overrides the scenario')
+    parser.add_argument('--seed', type=int,
+                        help='random seed, overrides the scenario')
+    parser.add_argument('--records', metavar='DIR',
+                        help='write the node records as csv files to DIR')
+    parser.add_argument('--replicas', type=int, default=1,
+                        help='run the scenario this many times in sequence '
+                        'and print the confidence intervals of the metrics')
+    args = parser.parse_args(argv)
+
+    scenario = load_scenario(args.scenario)
+    if args.seed is not None:
+        scenario['seed'] = args.seed
+
+    until = args.until if args.until is not None else \
+        scenario.get('until', 200)
+    if until <= 0:
+        parser.error('until must be greater than 0, got {}'.format(until))
+
+    if args.replicas > 1:
+        def callback(index: int, sim: Simulator):
+            if args.records:
+                write_records(sim, args.records, 'replica-{}-'.format(index))
+
+        ensemble = Ensemble(scenario, args.replicas)
+        ensemble.run(until=until, callback=callback)
+
+        summarize_ensemble(ensemble, until)
+        return
+
+    sim = build_simulator(scenario)
+    sim.run(until=until)
+
+    summarize(sim)
+
+    if args.records:
+        write_records(sim, args.records)
+
+
+if __name__ == '__main__':
+    main()
@@ -9,20 +9,24 @@ from clustersim.core.scheduler import Scheduler, get_scheduler
 
 
 class Dispatcher:
-    def __init__(self, env: Environment):
+    def __init__(self, env: Environment,
+                 rng: Optional[random.Random] = None):
         self.env: Optional[Environment] = env
+        # random number generator shared with the workloads and schedulers,
+        # the global random module if not given
+        self.rng = rng if rng is not None else random
         self.workloads: List[Workload] = []
         self.schedulers: List[Scheduler] = []
 
     def add_workload(self, workloadType: str, **args) -> Workload:
-        workload = get_workload(self.env, workloadType, **args)
+        workload = get_workload(self.env, workloadType, rng=self.rng, **args)
 
         self.workloads.append(workload)
         return workload
 
     def add_scheduler(self, schedulerType: str, nodes: List[Node], *args, **kwargs) -> Scheduler:
         scheduler = get_scheduler(
-            self.env, schedulerType, nodes, *args, **kwargs)
+            self.env, schedulerType, nodes, *args, rng=self.rng, **kwargs)
 
         self.schedulers.append(scheduler)
         return scheduler
@@ -33,12 +37,13 @@ def dispatch(self, job):
 
 
 class SingleDispatcher(Dispatcher):
-    def __init__(self, env: Environment):
-        Dispatcher.__init__(self, env)
+    def __init__(self, env: Environment,
+                 rng: Optional[random.Random] = None):
+        Dispatcher.__init__(self, env, rng)
 
     def dispatch(self, job):
         """dispatch the job to scheduler"""
-        scheduler = random.choice(self.schedulers)
+        scheduler = self.rng.choice(self.schedulers)
         scheduler.add(job)
 
     def run(self):
@@ -56,8 +61,9 @@ class SingleDispatcher(Dispatcher):
                 self.env.step()
 
 
-def get_dispatcher(env: Environment, dispatcherType: str) -> Dispatcher:
+def get_dispatcher(env: Environment, dispatcherType: str,
+                   rng: Optional[random.Random] = None) -> Dispatcher:
     if dispatcherType == 'random':
-        return SingleDispatcher(env)
+        return SingleDispatcher(env, rng)
 
     raise Exception(f'No dispatcher type: {dispatcherType}')
@@ -0,0 +1,128 @@
+"""
+ensemble module runs independent replicas of a scenario in one process:
+
+- Ensemble: runs the replicas sequentially, each on its own environment
+  and random number generator, and summarizes their metrics with Student-t
+  confidence intervals. The replicas are not batched, running them in one
+  process only saves the interpreter and import startup of separate runs.
+"""
+
+from typing import List, Dict, Tuple, Callable, Optional
+import math
+import random
+
+from clustersim.core.scenario import ScenarioType, build_simulator
+from clustersim.core.simulator import Simulator
+
+IntervalType = Tuple[float, float, float]
+
+
+def t_quantile(confidence: float, df: int) -> float:
+    """ two-sided quantile of the Student-t distribution with `df` degrees of
+    freedom, i.e. t such that P(|T| < t) = confidence
+    """
+
+    def prob(t: float) -> float:
+        # P(|T| < t) for integer degrees of freedom, Abramowitz & Stegun 26.7.3
+        theta = math.atan(t / math.sqrt(df))
+        cos2 = math.cos(theta) ** 2
+
+        if df % 2 == 1:
+            term, total = math.cos(theta), 0.0
+            for k in range(1, (df - 1) // 2 + 1):
+                total += term
+                term *= cos2 * (2 * k) / (2 * k + 1)
+            return 2 / math.pi * (theta + math.sin(theta) * total)
+
+        term, total = 1.0, 0.0
+        for k in range(1, df // 2 + 1):
+            total += term
+            term *= cos2 * (2 * k - 1) / (2 * k)
+        return math.sin(theta) * total
+
+    low, high = 0.0, 1.0
+    while prob(high) < confidence:
+        high *= 2
+
+    for _ in range(100):
+        mid = (low + high) / 2
+        if prob(mid) < confidence:
+            low = mid
+        else:
+            high = mid
+
+    return (low + high) / 2
+
+
+class Ensemble:
+    """ Sequential replicas of a scenario. A replica is built when it runs
+    and dropped once its metrics are collected, so one is in memory at a
+    time.
+    """
+
+    def __init__(self, scenario: ScenarioType, replicas: int,
+                 seed: Optional[int] = None):
+        # the explicit seed wins over the scenario seed, and monitors don't
+        # apply to ensembles
+        self.scenario = dict(scenario)
+        scenario_seed = self.scenario.pop('seed', None)
+        self.scenario.pop('monitor', None)
+
+        self.seed = seed if seed is not None else scenario_seed
+        self.replicas = replicas
+        self.results: List[Dict[str, float]] = []
+
+    def build(self, index: int) -> Simulator:
+        """ build replica `index`, its generator is derived from the ensemble
+        seed and index only, so a replica can be reproduced on its own
+        """
+        if self.seed is None:
+            rng = random.Random()
+        else:
+            rng = random.Random('{}-{}'.format(self.seed, index))
+
+        return build_simulator(self.scenario, rng=rng)
+
+    def run(self, until=200,
+            callback: Optional[Callable[[int, Simulator], None]] = None):
+        """ run the replicas one after another, `callback` is called with the
+        index and simulator of each replica after it ran
+        """
+        self.results = []
+
+        for index in range(self.replicas):
+            sim = self.build(index)
+            sim.run(until=until)
+
+            if callback:
+                callback(index, sim)
+            self.results.append(sim.metrics())
+
+    def metrics(self) -> List[Dict[str, float]]:
+        """ metrics of every replica that ran
+        """
+        return self.results
+
+    def summary(self, confidence: float = 0.95) -> Dict[str, IntervalType]:
+        """ mean and Student-t confidence interval of each metric over the
+        replicas
+        """
+        samples: Dict[str, List[float]] = {}
+        for metrics in self.metrics():
+            for key, value in metrics.items():
+                if not math.isnan(value):
+                    samples.setdefault(key, []).append(value)
+
+        summary: Dict[str, IntervalType] = {}
+        for key, values in samples.items():
+            n = len(values)
+            mean = sum(values) / n
+            if n > 1:
+                stdev = math.sqrt(
+                    sum((value - mean) ** 2 for value in values) / (n - 1))
+                err = t_quantile(confidence, n - 1) * stdev / math.sqrt(n)
+            else:
+                err = float('nan')
+            summary[key] = (mean, mean - err, mean + err)
+
+        return summary
@@ -0,0 +1,128 @@
+"""
+monitor module publishes live snapshots of a running simulation:
+
+- Monitor: samples the cluster state at a wall-clock interval and hands
+  the snapshots to its sinks.
+- FileSink: appends snapshots as json lines to a file, to be followed
+  with `tail -f`.
+- AsyncioSink: puts snapshots on an asyncio queue, for a simulation that
+  runs in a worker thread of an event loop.
+"""
+
+from typing import List, Dict, Any, Callable, Optional, TYPE_CHECKING
+import json
+import time
+
+if TYPE_CHECKING:
+    import asyncio
+    from clustersim.core.simulator import Simulator
+
+SnapshotType = Dict[str, Any]
+SinkType = Callable[[SnapshotType], None]
+
+
+class Monitor:
+    """ Sample the simulation every `interval` seconds of wall-clock time.
+
+    The simulator polls the monitor every `steps` events, so the overhead
+    is a clock read per `steps` events while no sample is due.
+    """
+
+    def __init__(self, sim: 'Simulator', interval: float = 1.0,
+                 steps: int = 1000):
+        self.sim = sim
+        self.interval = interval
+        self.steps = steps
+        self.sinks: List[SinkType] = []
+
+        self.started: float = time.monotonic()
+        self.next_sample: float = self.started
+        self.stopped = False
+
+    def start(self):
+        """ reset the clock when the simulation starts running
+        """
+        self.started = time.monotonic()
+        self.next_sample = self.started
+
+    def add_sink(self, sink: SinkType) -> SinkType:
+        self.sinks.append(sink)
+        return sink
+
+    def stop(self):
+        """ stop the simulation at the next poll, e.g. when a run went wrong
+        """
+        self.stopped = True
+
+    def snapshot(self) -> SnapshotType:
+        env = self.sim.env
+        dispatcher = self.sim.dispatcher
+
+        workloads = dispatcher.workloads if dispatcher else []
+        schedulers = dispatcher.schedulers if dispatcher else []
+
+        finished = sum(len(scheduler.records['task_total'])
+                       for scheduler in schedulers)
+
+        return {
+            'wall_time': time.monotonic() - self.started,
+            'sim_time': env.now,
+            'workload_queues': [len(workload.queue) for workload in workloads],
+            'scheduler_queues': [scheduler.queued() for scheduler in schedulers],
+            'nodes': {node.node_id: node.utilization() for node in self.sim.nodes},
+            'finished': finished,
+            'throughput': finished / env.now if env.now > 0 else 0.0,
+        }
+
+    def publish(self):
+        snapshot = self.snapshot()
+        for sink in self.sinks:
+            sink(snapshot)
+
+    def poll(self):
+        now = time.monotonic()
+        if now < self.next_sample:
+            return
+
+        self.next_sample = now + self.interval
+        self.publish()
+
+    def close(self):
+        """ publish the final snapshot and close the sinks that need it
+        """
+        self.publish()
+
+        for sink in self.sinks:
+            close = getattr(sink, 'close', None)
+            if close:
+                close()
+
+
+class FileSink:
+    def __init__(self, path: str):
+        self.file = open(path, 'a')
+
+    def __call__(self, snapshot: SnapshotType):
+        self.file.write(json.dumps(snapshot) + '\n')
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+class AsyncioSink:
+    """ Forward snapshots to an asyncio queue from the simulation thread.
+
+    Create the sink on the event loop thread, then run the simulation with
+    `loop.run_in_executor` and consume the queue from a coroutine.
+    """
+
+    def __init__(self, queue: 'asyncio.Queue',
+                 loop: Optional['asyncio.AbstractEventLoop'] = None):
+        import asyncio
+
+        self.queue = queue
+        self.loop = loop or asyncio.get_running_loop()
+
+    def __call__(self, snapshot: SnapshotType):
+        self.loop.call_soon_threadsafe(self.queue.put_nowait, snapshot)
@@ -1,15 +1,18 @@
-from typing import List, Dict, Tuple, Set, Any, Optional
+from typing import List, Dict, Tuple, Set, Any, Optional, TYPE_CHECKING
 import copy
-from dataclasses import dataclass
 
 from simpy import Environment
 
-from pandas import DataFrame
+if TYPE_CHECKING:
+    from pandas import DataFrame
 
 ResourcesMapType = Dict[str, 'Resource']
 
 
 class Resource:
+    # column name of the utilization of this resource in node records
+    util_key = 'util'
+
     def __init__(self):
         pass
 
@@ -27,8 +30,20 @@ class Resource:
         raise NotImplementedError('Not implemented')
         return 0.0
 
+    def capacity(self) -> float:
+        """ total amount of the resource, in the unit of demand()
+        """
+        raise NotImplementedError('Not implemented')
+
+    def demand(self, request) -> float:
+        """ amount of the resource a request asks for, as a single scalar
+        """
+        raise NotImplementedError('Not implemented')
+
 
 class Cpu(Resource):
+    util_key = 'cpu-util'
+
     def __init__(self, cpu: float):
         self.cpu = cpu
         self.remaining = cpu
@@ -49,8 +64,16 @@ class Cpu(Resource):
     def utilization(self) -> float:
         return (self.cpu - self.remaining) / self.cpu
 
+    def capacity(self) -> float:
+        return self.cpu
+
+    def demand(self, cpu: float) -> float:
+        return cpu
+
 
 class Mem(Resource):
+    util_key = 'mem-util'
+
     def __init__(self, mem: float):
         self.mem = mem
         self.remaining = mem
@@ -71,11 +94,19 @@ class Mem(Resource):
     def utilization(self) -> float:
         return (self.mem - self.remaining) / self.mem
 
+    def capacity(self) -> float:
+        return self.mem
+
+    def demand(self, mem: float) -> float:
+        return mem
+
 
 Gpus = List[float]
 
 
 class GpuSet(Resource):
+    util_key = 'gpu-util'
+
     def __init__(self, gpus: List[float]):
         """ Gpu resource is modeled as list of gpu memory of all gpus on a node.
         """
@@ -94,6 +125,9 @@ class GpuSet(Resource):
         availables = sorted(self.remaining, reverse=True)
         requests = sorted(request, reverse=True)
 
+        if len(requests) > len(availables):
+            return False
+
         for i, req in enumerate(requests):
             if availables[i] < req:
                 return False
@@ -117,6 +151,23 @@ class GpuSet(Resource):
     def utilization(self) -> float:
         return (sum(self.gpus) - sum(self.remaining)) / sum(self.gpus)
 
+    def capacity(self) -> float:
+        return sum(self.gpus)
+
+    def demand(self, request: Gpus) -> float:
+        return sum(request)
+
+
+def get_resource(resourceType: str, spec: Any) -> Resource:
+    if resourceType == 'cpu':
+        return Cpu(spec)
+    elif resourceType == 'mem':
+        return Mem(spec)
+    elif resourceType == 'gpus':
+        return GpuSet(list(spec))
+
+    raise Exception(f'No resource type: {resourceType}')
+
 
 class Node:
     def __init__(self, env, node_id: int, resources: ResourcesMapType):
@@ -126,8 +177,8 @@ class Node:
 
         # gather statistics about the node
         self.tasks = 0
-        self.records = DataFrame(
-            columns=['cpu-util', 'mem-util', 'gpu-util', 'tasks'])
+        self.columns = ['cpu-util', 'mem-util', 'gpu-util', 'task']
+        self.rows: List[Tuple[float, Dict]] = []
 
         # self.records: Dict[str, List[tuple]] = defaultdict(lambda: [(0, 0.0)])
 
@@ -135,12 +186,9 @@ class Node:
         return 'Node {} with resources {}'.format(self.node_id, self.resources)
 
     def satisfy(self, resources: ResourcesMapType) -> bool:
-        success = all(self.resources[name].satisfy(resource)
-                      for name, resource in resources.items())
-        # print('%d: Try to allocate %s with %s %s' %
-        #       (self.env.now, resources['gpus'], self.resources['gpus'], success))
-
-        return all(self.resources[name].satisfy(resource)
+        # a node without a requested resource type can't host the request
+        return all(name in self.resources and
+                   self.resources[name].satisfy(resource)
                    for name, resource in resources.items())
 
     def alloc(self, resources: ResourcesMapType) -> ResourcesMapType:
@@ -153,11 +201,7 @@ class Node:
             ret[name] = self.resources[name].alloc(resource)
 
         self.tasks += 1
-
-        self.record({
-            'task': self.tasks,
-            'gpu-util': self.resources['gpus'] .utilization(),
-        })
+        self.record(self.utilization())
 
         return ret
 
@@ -166,18 +210,33 @@ class Node:
             self.resources[name].dealloc(resource)
 
         self.tasks -= 1
+        self.record(self.utilization())
+
+    def utilization(self) -> Dict[str, float]:
+        """ current task count and utilization of every resource on the node
+        """
+        row: Dict[str, float] = {'task': self.tasks}
+        for resource in self.resources.values():
+            row[resource.util_key] = resource.utilization()
 
-        self.record({
-            'task': self.tasks,
-            'gpu-util': self.resources['gpus'] .utilization(),
-        })
+        return row
 
     def record(self, row: Dict):
         assert self.env is not None, \
             'Environment not initialized when recording'
 
-        self.records = self.records.append(
-            DataFrame(row, index=[self.env.now]))
+        self.rows.append((self.env.now, row))
+
+    @property
+    def records(self) -> 'DataFrame':
+        """ node statistics as a DataFrame indexed by time, pandas is only
+        imported when the records are materialized
+        """
+        from pandas import DataFrame
+
+        return DataFrame([row for _, row in self.rows],
+                         index=[now for now, _ in self.rows],
+                         columns=self.columns)
 
         # """ if self.env.now != 0:
         #     self.records[key].append((self.env.now-1, self.records[key])) """
@@ -0,0 +1,90 @@
+"""
+scenario module builds a simulator from a declarative description, loaded
+from a json or yaml file:
+
+    seed: 42
+    until: 2000
+    nodes:
+      - count: 1
+        resources: {cpu: 16, mem: 64, gpus: [1, 1, 1, 1]}
+    dispatcher: random
+    workloads:
+      - type: closed_random
+        count: 4
+        income_range: [0, 0]
+        tasktime_range: [10, 100]
+        resources: {gpus: [0.2, 0.7]}
+    scheduler:
+      type: basic
+      scheme: worst_fit
+    monitor:
+      interval: 1.0
+      file: progress.jsonl
+
+Node resources are keyed by resource type (cpu, mem, gpus), `count`
+defaults to 1, and the scheduler gets all the nodes. `seed`, `until` and
+`monitor` are optional.
+"""
+
+from typing import Dict, Any, Optional
+import json
+import random
+
+from clustersim.core.simulator import Simulator
+from clustersim.core.resources import get_resource
+from clustersim.core.monitor import FileSink
+
+ScenarioType = Dict[str, Any]
+
+
+def load_scenario(path: str) -> ScenarioType:
+    with open(path) as f:
+        if path.endswith(('.yaml', '.yml')):
+            # yaml is optional, only needed for yaml scenarios
+            import yaml
+            return yaml.safe_load(f)
+
+        return json.load(f)
+
+
+def build_simulator(scenario: ScenarioType,
+                    rng: Optional[random.Random] = None) -> Simulator:
+    """ build the simulator of a scenario, random numbers are drawn from
+    `rng` if given, or from a generator seeded with the scenario seed
+    """
+    for key in ('nodes', 'workloads', 'scheduler'):
+        if key not in scenario:
+            raise Exception(f'Scenario missing required key: {key}')
+
+    if rng is None and 'seed' in scenario:
+        rng = random.Random(scenario['seed'])
+
+    sim = Simulator(rng=rng)
+
+    for spec in scenario['nodes']:
+        for _ in range(spec.get('count', 1)):
+            sim.add_node({name: get_resource(name, resource)
+                          for name, resource in spec['resources'].items()})
+
+    dispatcher = sim.add_dispatcher(scenario.get('dispatcher', 'random'))
+
+    for spec in scenario['workloads']:
+        args = dict(spec)
+        workloadType = args.pop('type')
+        count = args.pop('count', 1)
+
+        args['income_range'] = tuple(args['income_range'])
+        args['tasktime_range'] = tuple(args['tasktime_range'])
+
+        for _ in range(count):
+            dispatcher.add_workload(workloadType, **args)
+
+    args = dict(scenario['scheduler'])
+    dispatcher.add_scheduler(args.pop('type'), sim.nodes, **args)
+
+    if 'monitor' in scenario:
+        monitor = sim.add_monitor(scenario['monitor'].get('interval', 1.0))
+        if 'file' in scenario['monitor']:
+            monitor.add_sink(FileSink(scenario['monitor']['file']))
+
+    return sim
@@ -1,6 +1,6 @@
-from typing import List, Optional, Set
+from typing import List, Dict, Optional, Set, Tuple
 import random
-from collections import defaultdict
+from collections import defaultdict, deque
 import copy
 
 from simpy import Environment
@@ -10,15 +10,23 @@ from clustersim.core.workload import Workload, Work, Task, get_workload
 
 
 class Scheduler:
-    def __init__(self, env: Environment, nodes: List[Node]):
+    def __init__(self, env: Environment, nodes: List[Node],
+                 rng: Optional[random.Random] = None):
         self.queue: List[Work] = []
         self.env: Environment = env
         self.nodes: List[Node] = nodes
+        # random number generator, the global random module if not given
+        self.rng = rng if rng is not None else random
         self.records: defaultdict = defaultdict(list)
 
     def schedule(self, work: Work, node: Node, alloc: ResourcesMapType):
         raise NotImplementedError('Not implemented')
 
+    def queued(self) -> int:
+        """ number of works waiting to be scheduled
+        """
+        return len(self.queue)
+
     def run(self):
         raise NotImplementedError('Not implemented')
 
@@ -28,8 +36,9 @@ class BasicScheduler(Scheduler):
                  env: Environment,
                  nodes: List[Node],
                  scheme: str = 'worst_fit',
+                 rng: Optional[random.Random] = None,
                  ):
-        Scheduler.__init__(self, env, nodes)
+        Scheduler.__init__(self, env, nodes, rng)
         self.scheme = scheme
 
     def add(self, job):
@@ -56,8 +65,15 @@ class BasicScheduler(Scheduler):
     def schedule(self, task: Task, node: Node) -> ResourcesMapType:
         alloc: ResourcesMapType = dict()
 
-        alloc['gpus'] = self.schedule_gpu(
-            node.resources['gpus'], task.resources['gpus'])
+        for name, request in task.resources.items():
+            resource = node.resources[name]
+
+            # gpus are allocated on distinct devices following the scheme,
+            # scalar resources are taken from the node as requested
+            if isinstance(resource, GpuSet):
+                alloc[name] = self.schedule_gpu(resource, request)
+            else:
+                alloc[name] = request
 
         return alloc
 
@@ -76,7 +92,7 @@ class BasicScheduler(Scheduler):
                 key=lambda x: x[1],
             )
         elif self.scheme == 'random':
-            availables = random.sample(
+            availables = self.rng.sample(
                 list(remaining), k=len(node_gpus.remaining))
         else:
             raise Exception('Unknown basic scheduling scheme %s' % self.scheme)
@@ -126,6 +142,108 @@ class BasicScheduler(Scheduler):
         self.records[key].append((self.env.now, value))
 
 
+class DRFScheduler(BasicScheduler):
+    """ Dominant Resource Fairness scheduler: the pending task of the workload
+    with the lowest dominant share is scheduled first.
+
+    A workload's dominant share is the largest fraction of any cluster
+    resource type it currently holds. Shares are updated incrementally
+    when tasks start and finish, and pending tasks are kept in a FIFO queue
+    per workload, so a decision only tries the head task of each workload.
+    """
+
+    def __init__(self,
+                 env: Environment,
+                 nodes: List[Node],
+                 scheme: str = 'worst_fit',
+                 rng: Optional[random.Random] = None,
+                 ):
+        BasicScheduler.__init__(self, env, nodes, scheme, rng)
+
+        # total capacity of each resource type over the nodes
+        self.capacity: Dict[str, float] = defaultdict(float)
+        for node in nodes:
+            for name, resource in node.resources.items():
+                self.capacity[name] += resource.capacity()
+
+        self.usage: Dict[Workload, Dict[str, float]] = \
+            defaultdict(lambda: defaultdict(float))
+        self.shares: Dict[Workload, float] = defaultdict(float)
+        self.pending: Dict[Workload, deque] = defaultdict(deque)
+
+    def add(self, job):
+        self.pending[job.workload].append(job)
+
+    def queued(self) -> int:
+        return sum(len(queue) for queue in self.pending.values())
+
+    def demand(self, task: Task, node: Node) -> Dict[str, float]:
+        return {name: node.resources[name].demand(request)
+                for name, request in task.resources.items()}
+
+    def update_share(self, task: Task, demand: Dict[str, float], sign: int):
+        usage = self.usage[task.workload]
+        for name, amount in demand.items():
+            usage[name] += sign * amount
+
+        self.shares[task.workload] = max(
+            (usage[name] / self.capacity[name]
+             for name in usage if self.capacity[name] > 0),
+            default=0.0)
+
+    def find_work(self) -> Optional[Tuple[Task, Node]]:
+        workloads = sorted((workload for workload, queue in self.pending.items()
+                            if queue),
+                           key=lambda workload: self.shares[workload])
+
+        for workload in workloads:
+            task = self.pending[workload][0]
+            node = self.find_node(task.resources)
+            if node:
+                return task, node
+        return None
+
+    def start_work(self, work: Work, node: Node, alloc: ResourcesMapType):
+        demand = self.demand(work, node)
+
+        # account for the task before the next decision is made
+        self.update_share(work, demand, 1)
+
+        work.scheduled_time = self.env.now
+        self.env.process(self.track_work(work, node, alloc, demand))
+
+    def track_work(self, task: Task, node: Node, alloc: ResourcesMapType,
+                   demand: Dict[str, float]):
+        yield self.env.process(task.run(self.records, node, alloc))
+        self.update_share(task, demand, -1)
+
+    def run(self):
+        assert self.env is not None, 'Scheduler environment is none'
+
+        while True:
+            if not self.find_work():
+                yield self.env.timeout(1)
+                continue
+
+            # a scheduling decision takes one time unit, decide on the state
+            # after it, since tasks may have finished or arrived meanwhile
+            yield self.env.timeout(1)
+
+            found = self.find_work()
+            if found:
+                task, node = found
+
+                alloc = self.schedule(task, node)
+                node.alloc(alloc)
+
+                self.pending[task.workload].popleft()
+                self.start_work(task, node, alloc)
+
+
 def get_scheduler(env: Environment, schedulerType: str, nodes: List[Node], *args, **kwargs) -> Scheduler:
     if schedulerType == 'basic':
         return BasicScheduler(env, nodes, *args, **kwargs)
+    elif schedulerType == 'drf':
+        return DRFScheduler(env, nodes, *args, **kwargs)
+
+    raise Exception(f'No scheduler type: {schedulerType}')
@@ -1,4 +1,5 @@
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Union, TYPE_CHECKING
+import random
 
 from .dispatcher import get_dispatcher, Dispatcher
 from .resources import Node, Resource, ResourcesMapType
@@ -6,21 +7,32 @@ from .workload import Workload, Task, Job
 
 import simpy
 from simpy import Environment
+from simpy.core import StopSimulation
+
+if TYPE_CHECKING:
+    from .monitor import Monitor
 
 
 class Simulator:
-    def __init__(self, configs: Dict[str, Any] = {}):
+    def __init__(self, configs: Dict[str, Any] = {},
+                 rng: Optional[random.Random] = None):
         """ workloads: List[Workload] = [],
         nodes: List[Node] = [],
         dispatcher: Optional[Dispatcher] = None,
-        configs: Dict[str, Any] = {}): """
+        configs: Dict[str, Any] = {}):
+
+        rng: random number generator of the workloads and schedulers, the
+        global random module if not given
+        """
 
         self.env = Environment()
+        self.rng = rng
         self.inqueue: simpy.Store = simpy.Store(self.env)
 
         self.nodes: List[Node] = []
         self.workloads: List[Workload] = []
         self.dispatcher: Optional[Dispatcher] = None
+        self.monitors: List['Monitor'] = []
         self.configs: Dict[str, Any] = {}
 
     def add_node(self, resources: ResourcesMapType) -> Node:
@@ -30,11 +42,20 @@ class Simulator:
         return node
 
     def add_dispatcher(self, dispatcherType: str) -> Dispatcher:
-        dispatcher = get_dispatcher(self.env, dispatcherType)
+        dispatcher = get_dispatcher(self.env, dispatcherType, self.rng)
 
         self.dispatcher = dispatcher
         return dispatcher
 
+    def add_monitor(self, interval: float = 1.0,
+                    steps: int = 1000) -> 'Monitor':
+        from .monitor import Monitor
+
+        monitor = Monitor(self, interval, steps)
+
+        self.monitors.append(monitor)
+        return monitor
+
     def log(self, msg):
         self.logs.append((self.env.now, msg))
 
@@ -42,10 +63,84 @@ class Simulator:
         for log in self.logs:
             print(log[0], log[1])
 
-    def run(self, until=200):
+    def start(self):
+        """ register the simulation processes on the environment
+        """
+        assert self.dispatcher is not None, 'No dispatcher specified'
+
         for workload in self.dispatcher.workloads:
             self.env.process(workload.run())
 
         self.env.process(self.dispatcher.run())
 
-        self.env.run(until=until)
+    def metrics(self) -> Dict[str, float]:
+        """ summary metrics of the run, computed from the raw records. Node
+        task counts and utilizations are averaged over time, each record
+        holding until the next one, and the node idle before its first one
+        """
+        assert self.dispatcher is not None, 'No dispatcher specified'
+
+        def mean(values: List[float]) -> float:
+            return sum(values) / len(values) if values else float('nan')
+
+        schedulers = self.dispatcher.schedulers
+        finished = sum(len(scheduler.records['task_total'])
+                       for scheduler in schedulers)
+
+        metrics: Dict[str, float] = {
+            'finished': finished,
+            'queued': sum(scheduler.queued() for scheduler in schedulers),
+            'throughput': finished / self.env.now if self.env.now > 0 else 0.0,
+        }
+
+        for key in ('task_runtime', 'task_waittime', 'task_total'):
+            metrics[key] = mean([value for scheduler in schedulers
+                                 for _, value in scheduler.records[key]])
+
+        for node in self.nodes:
+            totals: Dict[str, float] = {}
+            ends = [now for now, _ in node.rows[1:]] + [self.env.now]
+            for (now, row), end in zip(node.rows, ends):
+                for key, value in row.items():
+                    totals[key] = totals.get(key, 0.0) + value * (end - now)
+
+            for key, total in totals.items():
+                metrics['node{}-{}'.format(node.node_id, key)] = \
+                    total / self.env.now if self.env.now > 0 else float('nan')
+
+        return metrics
+
+    def run(self, until=200):
+        self.start()
+
+        if not self.monitors:
+            self.env.run(until=until)
+            return
+
+        # step through the events like Environment.run, to give the monitors
+        # a chance to sample in between
+        stop = self.env.timeout(until - self.env.now)
+        stop.callbacks.append(StopSimulation.callback)
+
+        for monitor in self.monitors:
+            monitor.start()
+
+        monitors = self.monitors
+        steps = range(min(monitor.steps for monitor in monitors))
+        step = self.env.step
+
+        try:
+            while True:
+                for _ in steps:
+                    step()
+
+                for monitor in monitors:
+                    monitor.poll()
+
+                if any(monitor.stopped for monitor in monitors):
+                    break
+        except StopSimulation:
+            pass
+
+        for monitor in monitors:
+            monitor.close()
@@ -23,8 +23,11 @@ class Workload:
     """ Define a type of workload, that generates a category of jobs
     """
 
-    def __init__(self, env: Environment):
+    def __init__(self, env: Environment,
+                 rng: Optional[random.Random] = None):
         self.env: Optional[Environment] = env
+        # random number generator, the global random module if not given
+        self.rng = rng if rng is not None else random
 
     def generate(self) -> Union['Task', 'Job']:
         raise NotImplementedError('Not implemented')
@@ -42,8 +45,9 @@ class UnifiedRandomWorkload(Workload):
 
     def __init__(self, env: Environment,
                  income_range: Tuple[int, int], tasktime_range: Tuple[int, int],
-                 resources: ResourcesMapType):
-        Workload.__init__(self, env)
+                 resources: ResourcesMapType,
+                 rng: Optional[random.Random] = None):
+        Workload.__init__(self, env, rng)
 
         self.income_range = income_range
         self.tasktime_range = tasktime_range
@@ -57,7 +61,7 @@ class UnifiedRandomWorkload(Workload):
 
         task = Task(self, self.jobid,
                     self.jobid,
-                    random.uniform(*self.tasktime_range),
+                    self.rng.uniform(*self.tasktime_range),
                     resources=self.resources)
         self.jobid += 1
         return task
@@ -69,7 +73,7 @@ class UnifiedRandomWorkload(Workload):
         assert self.env is not None, 'No environment specified'
 
         while True:
-            yield self.env.timeout(random.uniform(*self.income_range))
+            yield self.env.timeout(self.rng.uniform(*self.income_range))
             job = self.generate()
 
             self.queue.append(job)
@@ -81,8 +85,9 @@ class ClosedWorkload(Workload):
 
     def __init__(self, env: Environment,
                  income_range: Tuple[int, int], tasktime_range: Tuple[int, int],
-                 resources: ResourcesMapType):
-        Workload.__init__(self, env)
+                 resources: ResourcesMapType,
+                 rng: Optional[random.Random] = None):
+        Workload.__init__(self, env, rng)
 
         self.income_range = income_range
         self.tasktime_range = tasktime_range
@@ -94,7 +99,7 @@ class ClosedWorkload(Workload):
 
     def generate(self) -> Union['Task']:
         task = Task(self, self.jobid, self.jobid,
-                    random.uniform(*self.tasktime_range), resources=self.resources)
+                    self.rng.uniform(*self.tasktime_range), resources=self.resources)
         self.jobid += 1
 
         return task
@@ -123,6 +128,8 @@ def get_workload(env: Environment, workloadType: str, **args) -> Workload:
     elif workloadType == 'closed_random':
         return ClosedWorkload(env, **args)
 
+    raise Exception(f'No workload type: {workloadType}')
+
 
 class WorkStatus(Enum):
     INIT = auto()
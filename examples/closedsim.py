@@ -3,8 +3,6 @@ from clustersim.core.workload import ClosedWorkload
 from clustersim.core.resources import Cpu, Mem, Gpus, GpuSet, Node
 import clustersim.core.scheduler
 
-from matplotlib import pyplot as plt
-
 sim = Simulator()
 
 sim.add_node({'gpus': GpuSet([1, 1, 1, 1])})
@@ -1,8 +1,6 @@
 from clustersim.core.simulator import Simulator
 from clustersim.core.resources import GpuSet
 
-from matplotlib import pyplot as plt
-
 
 sim = Simulator()
 
@@ -10,6 +10,15 @@ setup(
     url='https://github.com/hxy9243/scheduler_simulator',
     license='MIT License',
     install_requires=['simpy'],
+    extras_require={
+        'yaml': ['pyyaml'],
+        'results': ['pandas'],
+    },
+    entry_points={
+        'console_scripts': [
+            'clustersim=clustersim.core.cli:main',
+        ],
+    },
     packages=find_packages(where='.'),
     package_dir={
         'clustersim': '',
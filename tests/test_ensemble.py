@@ -0,0 +1,72 @@
+import pytest
+
+from clustersim.core.ensemble import Ensemble, t_quantile
+from clustersim.core.resources import GpuSet
+from clustersim.core.simulator import Simulator
+
+
+SCENARIO = {
+    'seed': 1,
+    'nodes': [{'resources': {'gpus': [1, 1, 1, 1]}}],
+    'workloads': [
+        {
+            'type': 'unified_random',
+            'income_range': [4, 12],
+            'tasktime_range': [16, 36],
+            'resources': {'gpus': [0.5, 0.5]},
+        },
+    ],
+    'scheduler': {'type': 'basic'},
+}
+
+
+@pytest.mark.parametrize('df, expected', [
+    (1, 12.706), (2, 4.303), (9, 2.262), (10, 2.228), (30, 2.042),
+])
+def test_t_quantile(df, expected):
+    assert t_quantile(0.95, df) == pytest.approx(expected, abs=1e-3)
+
+
+def test_replica_reproducible_on_its_own():
+    ensemble = Ensemble(SCENARIO, 4, seed=7)
+    ensemble.run(until=500)
+
+    sim = Ensemble(SCENARIO, 1, seed=7).build(2)
+    sim.run(until=500)
+
+    assert ensemble.metrics()[2] == sim.metrics()
+    assert ensemble.metrics()[0] != ensemble.metrics()[1]
+
+
+def test_explicit_seed_wins():
+    assert Ensemble(SCENARIO, 2, seed=7).seed == 7
+    assert Ensemble(SCENARIO, 2).seed == 1
+
+
+def test_summary_interval():
+    ensemble = Ensemble(SCENARIO, 5, seed=7)
+    ensemble.run(until=500)
+
+    mean, low, high = ensemble.summary()['throughput']
+    values = [metrics['throughput'] for metrics in ensemble.metrics()]
+    assert mean == pytest.approx(sum(values) / len(values))
+    assert low < mean < high
+
+
+def test_node_metrics_are_time_weighted():
+    sim = Simulator()
+    node = sim.add_node({'gpus': GpuSet([1, 1])})
+    sim.add_dispatcher('random')
+
+    def use_gpu():
+        yield sim.env.timeout(2)
+        node.alloc({'gpus': [1, 0]})
+        yield sim.env.timeout(6)
+        node.dealloc({'gpus': [1, 0]})
+
+    sim.env.process(use_gpu())
+    sim.env.run(until=10)
+
+    metrics = sim.metrics()
+    assert metrics['node0-gpu-util'] == pytest.approx(0.3)
+    assert metrics['node0-task'] == pytest.approx(0.6)
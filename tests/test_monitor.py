@@ -0,0 +1,40 @@
+import json
+
+from clustersim.core.monitor import FileSink
+from clustersim.core.resources import GpuSet
+from clustersim.core.simulator import Simulator
+
+
+def make_sim():
+    sim = Simulator()
+    sim.add_node({'gpus': GpuSet([1, 1, 1, 1])})
+    dispatcher = sim.add_dispatcher('random')
+    dispatcher.add_workload('unified_random',
+                            income_range=(4, 12), tasktime_range=(16, 36),
+                            resources={'gpus': [0.5, 0.5]})
+    dispatcher.add_scheduler('basic', sim.nodes)
+    return sim
+
+
+def test_file_sink_writes_and_closes(tmp_path):
+    path = tmp_path / 'progress.jsonl'
+
+    sim = make_sim()
+    monitor = sim.add_monitor(interval=0.0, steps=100)
+    sink = monitor.add_sink(FileSink(str(path)))
+    sim.run(until=500)
+
+    snapshots = [json.loads(line) for line in path.read_text().splitlines()]
+    assert len(snapshots) > 1
+    assert snapshots[-1]['sim_time'] == 500
+    assert set(snapshots[-1]['nodes']['0']) == {'task', 'gpu-util'}
+    assert sink.file.closed
+
+
+def test_stop_ends_run_early():
+    sim = make_sim()
+    monitor = sim.add_monitor(interval=0.0, steps=10)
+    monitor.add_sink(lambda snapshot: monitor.stop())
+    sim.run(until=500)
+
+    assert sim.env.now < 500
@@ -0,0 +1,76 @@
+import json
+
+import pytest
+
+from clustersim.core import cli
+from clustersim.core.resources import Cpu, GpuSet
+from clustersim.core.scenario import build_simulator, load_scenario
+
+
+SCENARIO = {
+    'seed': 1,
+    'nodes': [
+        {'count': 2, 'resources': {'cpu': 16, 'gpus': [1, 1, 1, 1]}},
+    ],
+    'dispatcher': 'random',
+    'workloads': [
+        {
+            'type': 'unified_random',
+            'income_range': [4, 12],
+            'tasktime_range': [16, 36],
+            'resources': {'gpus': [0.5, 0.5]},
+        },
+    ],
+    'scheduler': {'type': 'basic', 'scheme': 'best_fit'},
+}
+
+
+def test_build_simulator():
+    sim = build_simulator(SCENARIO)
+
+    assert len(sim.nodes) == 2
+    assert isinstance(sim.nodes[1].resources['cpu'], Cpu)
+    assert isinstance(sim.nodes[1].resources['gpus'], GpuSet)
+    assert len(sim.dispatcher.workloads) == 1
+    assert sim.dispatcher.schedulers[0].scheme == 'best_fit'
+
+
+def test_seeded_runs_are_reproducible():
+    runs = []
+    for _ in range(2):
+        sim = build_simulator(SCENARIO)
+        sim.run(until=500)
+        runs.append(sim.metrics())
+
+    assert runs[0] == runs[1]
+
+
+def test_unknown_workload_type():
+    scenario = dict(SCENARIO, workloads=[
+        dict(SCENARIO['workloads'][0], type='unified_randm')])
+
+    with pytest.raises(Exception, match='No workload type: unified_randm'):
+        build_simulator(scenario)
+
+
+def test_missing_key():
+    scenario = dict(SCENARIO)
+    del scenario['scheduler']
+
+    with pytest.raises(Exception, match='missing required key: scheduler'):
+        build_simulator(scenario)
+
+
+def test_load_json(tmp_path):
+    path = tmp_path / 'scenario.json'
+    path.write_text(json.dumps(SCENARIO))
+
+    assert load_scenario(str(path)) == SCENARIO
+
+
+def test_cli_rejects_non_positive_until(tmp_path):
+    path = tmp_path / 'scenario.json'
+    path.write_text(json.dumps(SCENARIO))
+
+    with pytest.raises(SystemExit):
+        cli.main([str(path), '--until', '0'])
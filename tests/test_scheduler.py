@@ -0,0 +1,56 @@
+from simpy import Environment
+
+from clustersim.core.resources import Cpu, Mem, Node
+from clustersim.core.scheduler import DRFScheduler
+from clustersim.core.workload import UnifiedRandomWorkload
+
+
+def make_drf(resources, demands, tasks):
+    """ a DRF scheduler over one node, with `tasks` long running tasks
+    queued for each workload demand
+    """
+    env = Environment()
+    node = Node(env, 0, resources)
+    scheduler = DRFScheduler(env, [node])
+
+    workloads = []
+    for demand in demands:
+        workload = UnifiedRandomWorkload(env, income_range=(1, 1),
+                                         tasktime_range=(1000, 1000),
+                                         resources=demand)
+        workloads.append(workload)
+        for _ in range(tasks):
+            scheduler.add(workload.generate())
+
+    env.process(scheduler.run())
+    return env, scheduler, workloads
+
+
+def test_drf_alternates_equal_workloads():
+    env, scheduler, (a, b) = make_drf(
+        {'cpu': Cpu(4)}, [{'cpu': 1}, {'cpu': 1}], tasks=4)
+    queued = {workload: list(scheduler.pending[workload])
+              for workload in (a, b)}
+
+    env.run(until=100)
+
+    started = sorted((task for tasks in queued.values() for task in tasks
+                      if task.node is not None),
+                     key=lambda task: task.scheduled_time)
+    assert [task.workload for task in started] == [a, b, a, b]
+    assert scheduler.shares[a] == scheduler.shares[b] == 0.5
+
+
+def test_drf_paper_example():
+    # the example of the DRF paper: <1 cpu, 4 GB> and <3 cpu, 1 GB> tasks
+    # on 9 cpus and 18 GB
+    env, scheduler, (a, b) = make_drf(
+        {'cpu': Cpu(9), 'mem': Mem(18)},
+        [{'cpu': 1, 'mem': 4}, {'cpu': 3, 'mem': 1}], tasks=10)
+
+    env.run(until=100)
+
+    assert scheduler.usage[a] == {'cpu': 3, 'mem': 12}
+    assert scheduler.usage[b] == {'cpu': 6, 'mem': 2}
+    assert abs(scheduler.shares[a] - 2 / 3) < 1e-9
+    assert abs(scheduler.shares[b] - 2 / 3) < 1e-9